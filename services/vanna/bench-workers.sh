@@ -0,0 +1,68 @@
+#!/bin/bash
+# Compare Vanna service throughput across worker counts.
+# Needs a .env with GROQ_API_KEY and DATABASE_URL (run from services/vanna).
+#
+# Usage: ./bench-workers.sh [worker counts...]   (default: 1 2 4)
+# Env:   REQUESTS (default 200), CONCURRENCY (default 32), ENDPOINT (default /health),
+#        PORT (default 8100), DB_POOL_MAX (default 10)
+#
+# /health touches only the server and the per-worker DB pool, so it shows how
+# throughput scales with workers. ENDPOINT=/ask runs the end-to-end path, but
+# every request waits on Groq, which is rate-limited per API key, so it mostly
+# measures Groq rather than this server.
+
+WORKER_COUNTS=${@:-1 2 4}
+REQUESTS=${REQUESTS:-200}
+CONCURRENCY=${CONCURRENCY:-32}
+ENDPOINT=${ENDPOINT:-/health}
+PORT=${PORT:-8100}
+URL="http://localhost:$PORT$ENDPOINT"
+QUESTION='{"question": "What is the total spend per vendor?"}'
+
+# Prints "ok" or "fail" from the response body: /ask returns HTTP 200 even
+# when it fails, and /health returns 200 when the pool check times out
+send_request() {
+    if [ "$ENDPOINT" = "/ask" ]; then
+        BODY=$(curl -s -X POST -H "Content-Type: application/json" -d "$QUESTION" "$URL")
+        EXPECTED='"success":true'
+    else
+        BODY=$(curl -s "$URL")
+        EXPECTED='"database_connected":true'
+    fi
+    case "$BODY" in
+        *"$EXPECTED"*) echo "ok" ;;
+        *) echo "fail" ;;
+    esac
+}
+export -f send_request
+export URL ENDPOINT QUESTION
+
+echo "Benchmarking $ENDPOINT: $REQUESTS requests, concurrency $CONCURRENCY"
+echo ""
+printf "%-8s %-10s %-10s %-8s\n" "workers" "seconds" "req/s" "failed"
+
+for WORKERS in $WORKER_COUNTS; do
+    PORT=$PORT gunicorn -c gunicorn.conf.py -w "$WORKERS" main:app > "/tmp/vanna-bench-$WORKERS.log" 2>&1 &
+    SERVER_PID=$!
+
+    # Wait until every worker has finished its startup event
+    for _ in $(seq 1 60); do
+        STARTED=$(grep -c "initialized successfully" "/tmp/vanna-bench-$WORKERS.log" 2>/dev/null)
+        [ "$STARTED" -ge "$WORKERS" ] && break
+        sleep 1
+    done
+
+    START=$(date +%s.%N)
+    FAILED=$(seq "$REQUESTS" | xargs -P "$CONCURRENCY" -I{} bash -c send_request | grep -c "^fail$")
+    END=$(date +%s.%N)
+
+    kill "$SERVER_PID"
+    wait "$SERVER_PID" 2>/dev/null
+
+    SECONDS_TAKEN=$(awk "BEGIN { printf \"%.2f\", $END - $START }")
+    RATE=$(awk "BEGIN { printf \"%.1f\", $REQUESTS / ($END - $START) }")
+    printf "%-8s %-10s %-10s %-8s\n" "$WORKERS" "$SECONDS_TAKEN" "$RATE" "$FAILED"
+done
+
+echo ""
+echo "Server logs: /tmp/vanna-bench-<workers>.log"
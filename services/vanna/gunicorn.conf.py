@@ -0,0 +1,43 @@
+"""
+Gunicorn config for running the Vanna service with multiple workers
+Usage: gunicorn -c gunicorn.conf.py main:app
+"""
+
+import os
+from dotenv import load_dotenv
+
+# Gunicorn reads this file before importing main.py, so load .env here too
+load_dotenv()
+
+# Bind to the same HOST/PORT as `python main.py`
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', 8000)}"
+
+# Same default as main.py; `-w N` on the command line overrides this
+workers = int(os.getenv("WEB_CONCURRENCY", 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Import main.py once in the master and fork workers from it, so imported
+# modules are shared copy-on-write. DB pools are still opened per worker in
+# the FastAPI startup event (after fork).
+preload_app = True
+
+timeout = 60  # Groq calls time out at 30s
+graceful_timeout = 30
+loglevel = "info"
+
+
+def on_starting(server):
+    """Size DB pools from the real worker count"""
+    from vanna_service import pool_size_per_worker
+
+    workers = server.cfg.workers
+    db_pool_max = int(os.getenv("DB_POOL_MAX", 10))
+
+    # Refuse to start rather than exceed the connection budget
+    pool_size = pool_size_per_worker(db_pool_max, workers)
+    server.log.info(f"{workers} workers x {pool_size} DB connections (DB_POOL_MAX={db_pool_max})")
+
+    # Forked workers inherit this; main.py reads it in the startup event.
+    # The share is fixed here, so scaling up at runtime with TTIN is not
+    # supported: extra workers would exceed DB_POOL_MAX. Restart with `-w N`.
+    os.environ["WEB_CONCURRENCY"] = str(workers)
@@ -11,7 +11,7 @@ from pydantic import BaseModel
 from dotenv import load_dotenv
 import logging
 
-from vanna_service import VannaService
+from vanna_service import VannaService, pool_size_per_worker
 
 # Load environment variables
 load_dotenv()
@@ -57,9 +57,15 @@ async def startup_event():
         if not database_url:
             raise ValueError("DATABASE_URL not found in environment variables")
         
-        vanna_service = VannaService(groq_api_key, database_url)
+        # Read at startup (after fork): gunicorn.conf.py sets WEB_CONCURRENCY
+        # to the actual worker count, including a `-w` override
+        pool_size = pool_size_per_worker(
+            int(os.getenv("DB_POOL_MAX", 10)),
+            int(os.getenv("WEB_CONCURRENCY", 1))
+        )
+        vanna_service = VannaService(groq_api_key, database_url, pool_size=pool_size)
         await vanna_service.initialize()
-        logger.info("✅ Vanna AI Service initialized successfully")
+        logger.info(f"✅ Vanna AI Service initialized successfully (pid {os.getpid()})")
     except Exception as e:
         logger.error(f"❌ Failed to initialize Vanna service: {str(e)}")
         raise
@@ -138,7 +144,7 @@ async def health_check():
     
     return {
         "status": "healthy",
-        "database_connected": vanna_service.is_connected(),
+        "database_connected": await vanna_service.is_connected(),
         "model": "groq-llama3-70b",
         "timestamp": None
     }
@@ -249,11 +255,15 @@ if __name__ == "__main__":
     
     port = int(os.getenv("PORT", 8000))
     host = os.getenv("HOST", "0.0.0.0")
+    workers = int(os.getenv("WEB_CONCURRENCY", 1))
     
+    # Local runner (uvicorn spawns workers without preloading the app);
+    # production uses `gunicorn -c gunicorn.conf.py main:app` instead
     uvicorn.run(
         "main:app",
         host=host,
         port=port,
+        workers=workers,
         reload=False,  # Disabled to prevent constant restarts
         log_level="info"
     )
@@ -4,22 +4,41 @@ Handles Groq LLM integration and SQL generation/execution
 """
 
 import os
+import asyncio
+import threading
 from typing import List, Dict, Any
 import httpx
 import psycopg2
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def pool_size_per_worker(db_pool_max: int, workers: int) -> int:
+    """Split the total DB connection budget evenly across worker processes"""
+    if workers < 1:
+        raise ValueError("Worker count must be at least 1")
+    if workers > db_pool_max:
+        raise ValueError(
+            f"{workers} workers need at least {workers} connections, "
+            f"but DB_POOL_MAX is {db_pool_max}"
+        )
+    return db_pool_max // workers
+
+
 class VannaService:
     """Service class for Vanna AI operations with Groq LLM"""
     
-    def __init__(self, groq_api_key: str, database_url: str):
+    def __init__(self, groq_api_key: str, database_url: str, pool_size: int = 1):
         self.groq_api_key = groq_api_key
         self.database_url = database_url
-        self.connection = None  # Initialize connection first to avoid AttributeError
+        self.pool_size = max(1, pool_size)  # Max connections held by this worker
+        self.pool = None  # Initialize pool first to avoid AttributeError
+        # ThreadedConnectionPool raises when exhausted, so callers wait here instead
+        self._pool_slots = threading.BoundedSemaphore(self.pool_size)
+        self.health_check_timeout = 2.0  # Seconds is_connected waits for a free slot
         self.groq_base_url = "https://api.groq.com/openai/v1"  # Groq REST API endpoint
         
         # Parse database URL
@@ -39,9 +58,10 @@ class VannaService:
         try:
             logger.info("✅ Groq REST API configured")
             
-            # Connect to PostgreSQL
-            self.connection = psycopg2.connect(self.database_url)
-            logger.info("✅ Connected to PostgreSQL database")
+            # Connect to PostgreSQL (pool is created per worker, after fork).
+            # minconn == maxconn so returned connections stay open for reuse
+            self.pool = ThreadedConnectionPool(self.pool_size, self.pool_size, self.database_url)
+            logger.info(f"✅ Connected to PostgreSQL database (pool size: {self.pool_size})")
             
             # Load database schema
             await self._load_schema()
@@ -52,8 +72,9 @@ class VannaService:
     
     async def _load_schema(self):
         """Load database schema for context"""
+        connection = self._get_connection()
         try:
-            cursor = self.connection.cursor()
+            cursor = connection.cursor()
             
             # Get table information
             cursor.execute("""
@@ -74,6 +95,8 @@ class VannaService:
         except Exception as e:
             logger.error(f"Error loading schema: {str(e)}")
             raise
+        finally:
+            self._release_connection(connection)
     
     def _build_schema_context(self) -> str:
         """Build comprehensive schema description for LLM"""
@@ -308,35 +331,48 @@ SQL:"""
             logger.error(f"Error generating SQL: {str(e)}")
             raise
     
-    def _ensure_connection(self):
-        """Ensure database connection is alive, reconnect if needed"""
+    def _get_connection(self, timeout: float = None):
+        """Check out a live connection from the pool, replacing it if stale
+        
+        Raises TimeoutError if no pool slot frees up within `timeout` seconds
+        """
+        if not self._pool_slots.acquire(timeout=timeout):
+            raise TimeoutError(f"No pool connection available within {timeout}s")
         try:
-            if self.connection is None or self.connection.closed:
-                logger.info("🔄 Reconnecting to database...")
-                self.connection = psycopg2.connect(self.database_url)
-                logger.info("✅ Database reconnected")
-            else:
-                # Test connection
-                cursor = self.connection.cursor()
-                cursor.execute("SELECT 1")
-                cursor.close()
+            connection = self.pool.getconn()
+        except Exception:
+            self._pool_slots.release()
+            raise
+        try:
+            if connection.closed:
+                raise psycopg2.InterfaceError("connection already closed")
+            # Test connection
+            cursor = connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.close()
         except Exception as e:
             logger.warning(f"⚠️ Connection test failed, reconnecting: {str(e)}")
             try:
-                if self.connection:
-                    self.connection.close()
-            except:
-                pass
-            self.connection = psycopg2.connect(self.database_url)
+                self.pool.putconn(connection, close=True)
+                connection = self.pool.getconn()
+            except Exception:
+                self._pool_slots.release()
+                raise
             logger.info("✅ Database reconnected after failure")
+        return connection
     
-    async def execute_sql(self, sql: str) -> List[Dict[str, Any]]:
-        """Execute SQL query and return results"""
+    def _release_connection(self, connection):
+        """Return a connection checked out with _get_connection"""
         try:
-            # Ensure connection is alive before executing
-            self._ensure_connection()
-            
-            cursor = self.connection.cursor(cursor_factory=RealDictCursor)
+            self.pool.putconn(connection)
+        finally:
+            self._pool_slots.release()
+    
+    def _execute_sql_sync(self, sql: str) -> List[Dict[str, Any]]:
+        """Run a query on a pooled connection (called from a worker thread)"""
+        connection = self._get_connection()
+        try:
+            cursor = connection.cursor(cursor_factory=RealDictCursor)
             cursor.execute(sql)
             
             # Fetch results
@@ -346,14 +382,25 @@ SQL:"""
             results_list = [dict(row) for row in results]
             
             cursor.close()
+            return results_list
+        except Exception:
+            if not connection.closed:
+                connection.rollback()
+            raise
+        finally:
+            self._release_connection(connection)
+    
+    async def execute_sql(self, sql: str) -> List[Dict[str, Any]]:
+        """Execute SQL query and return results"""
+        try:
+            # Run off the event loop so concurrent requests can use the pool
+            results_list = await asyncio.to_thread(self._execute_sql_sync, sql)
             
             logger.info(f"Query executed. Rows returned: {len(results_list)}")
             return results_list
             
         except Exception as e:
             logger.error(f"Error executing SQL: {str(e)}")
-            if self.connection and not self.connection.closed:
-                self.connection.rollback()
             raise
     
     async def ask(self, question: str) -> Dict[str, Any]:
@@ -390,20 +437,28 @@ SQL:"""
         logger.info(f"SQL training not yet implemented: {question}")
         pass
     
-    def is_connected(self) -> bool:
-        """Check if database connection is active"""
+    def _check_connection(self) -> bool:
+        """Check out and return a pooled connection (called from a worker thread)"""
         try:
-            if self.connection is None:
+            if self.pool is None:
                 return False
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT 1")
-            cursor.close()
+            # Bounded wait: health probes must not queue behind slow user queries
+            connection = self._get_connection(timeout=self.health_check_timeout)
+            self._release_connection(connection)
             return True
+        except TimeoutError:
+            logger.warning("⚠️ Health check timed out waiting for a pool connection")
+            return False
         except:
             return False
     
+    async def is_connected(self) -> bool:
+        """Check if database connection is active"""
+        # Waiting for a pool slot must not block the event loop
+        return await asyncio.to_thread(self._check_connection)
+    
     def __del__(self):
-        """Cleanup database connection"""
-        if hasattr(self, 'connection') and self.connection:
-            self.connection.close()
-            logger.info("Database connection closed")
+        """Cleanup database connections"""
+        if hasattr(self, 'pool') and self.pool and not self.pool.closed:
+            self.pool.closeall()
+            logger.info("Database connections closed")